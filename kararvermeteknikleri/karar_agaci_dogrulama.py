@@ -0,0 +1,166 @@
+import itertools
+import random
+import sys
+
+from kararvermeteknikleriOOP import KararAgaci, KararDugumu, SansDugumu, SonucDugumu
+
+
+def rastgele_agac(derinlik, havuz, rastgele):
+    """
+        Karar, şans ve sonuç düğümlerinden rastgele bir ağaç oluşturur. Daha önce oluşturulan düğümler
+        havuzdan tekrar seçilerek paylaşılan alt ağaçlar (DAG) ve aynı isimli olaylar elde edilir.
+
+        Parameters:
+        - derinlik (int): Ağacın en fazla derinliği.
+        - havuz (list): Daha önce oluşturulmuş ve tekrar kullanılabilecek düğümler.
+        - rastgele (random.Random): Rastgele sayı üreteci.
+
+        Return:
+        - dugum (KararDugumu | SansDugumu | SonucDugumu): Oluşturulan ağacın kök düğümü.
+        """
+
+    secim = rastgele.random()
+    if derinlik == 0 or secim < 0.2:
+        return SonucDugumu(rastgele.randint(0, 9))
+    if havuz and secim < 0.35:
+        return rastgele.choice(havuz)
+
+    if secim < 0.65:
+        dallar = {f'S{i}': rastgele_agac(derinlik - 1, havuz, rastgele) for i in range(rastgele.randint(1, 3))}
+        dugum = KararDugumu(f'K{len(havuz)}', dallar)
+    else:
+        agirliklar = [rastgele.random() for _ in range(rastgele.randint(1, 3))]
+        olay = rastgele.choice(['A', 'B', f'O{len(havuz)}'])
+        dallar = [(f'D{i}', agirlik / sum(agirliklar), rastgele_agac(derinlik - 1, havuz, rastgele))
+                  for i, agirlik in enumerate(agirliklar)]
+        dugum = SansDugumu(olay, dallar)
+
+    havuz.append(dugum)
+    return dugum
+
+
+def kaba_kuvvet(kok, problem_turu):
+    """
+        Geriye doğru tümevarımı ve tam bilgi ile beklenen değeri memoizasyon kullanmadan, ağacı yol yol
+        dolaşarak ve tüm olayların her birlikte gerçekleşme senaryosunu tek tek sayarak hesaplar.
+
+        Returns:
+        - beklenen_deger (float): Kök düğümün beklenen değeri.
+        - tam_bilgi_ile_bd (float): Tam bilgi altında kök düğümün beklenen değeri.
+        """
+
+    en_iyi = max if problem_turu == 'K' else min
+
+    olaylar = {}
+    yigin = [kok]
+    while yigin:
+        dugum = yigin.pop()
+        if isinstance(dugum, SansDugumu):
+            olaylar[dugum.ad] = [olasilik for _, olasilik, _ in dugum.dallar]
+            yigin.extend(alt for _, _, alt in dugum.dallar)
+        elif isinstance(dugum, KararDugumu):
+            yigin.extend(dugum.dallar.values())
+
+    def beklenen(dugum):
+        if isinstance(dugum, SonucDugumu):
+            return dugum.deger
+        if isinstance(dugum, KararDugumu):
+            return en_iyi(beklenen(alt) for alt in dugum.dallar.values())
+        return sum(olasilik * beklenen(alt) for _, olasilik, alt in dugum.dallar)
+
+    def senaryo_degeri(dugum, senaryo):
+        if isinstance(dugum, SonucDugumu):
+            return dugum.deger
+        if isinstance(dugum, KararDugumu):
+            return en_iyi(senaryo_degeri(alt, senaryo) for alt in dugum.dallar.values())
+        return senaryo_degeri(dugum.dallar[senaryo[dugum.ad]][2], senaryo)
+
+    isimler = list(olaylar)
+    tam_bilgi_ile_bd = 0.0
+    for indeksler in itertools.product(*(range(len(olaylar[isim])) for isim in isimler)):
+        senaryo = dict(zip(isimler, indeksler))
+        olasilik = 1.0
+        for isim, indeks in senaryo.items():
+            olasilik *= olaylar[isim][indeks]
+        tam_bilgi_ile_bd += olasilik * senaryo_degeri(kok, senaryo)
+
+    return beklenen(kok), tam_bilgi_ile_bd
+
+
+def dogrula(agac_sayisi=1000, tohum=1):
+    """
+        Rastgele ağaçlarda KararAgaci sonuçlarını kaba kuvvet hesaplamasıyla karşılaştırır. Tam bilgi
+        hesabının reddettiği ağaçlar (aynı olayın bir yolda tekrar gözlemlenmesi gibi) atlanır.
+
+        Returns:
+        - kontrol_sayisi (int): Karşılaştırılan ağaç ve problem türü sayısı.
+        - hatalar (list): Sonuçları eşleşmeyen durumların açıklamaları.
+        """
+
+    rastgele = random.Random(tohum)
+    kontrol_sayisi = 0
+    hatalar = []
+
+    for sira in range(agac_sayisi):
+        kok = rastgele_agac(4, [], rastgele)
+
+        for problem_turu in ['K', 'M']:
+            try:
+                agac = KararAgaci(kok, problem_turu)
+                tam_bilgi_ile_bd = agac.tam_bilgi_ile_beklenen_deger()
+            except ValueError:
+                continue
+
+            beklenen_deger, beklenen_tam_bilgi = kaba_kuvvet(kok, problem_turu)
+            kontrol_sayisi += 1
+
+            if abs(agac.beklenen_deger - beklenen_deger) > 1e-9 or abs(tam_bilgi_ile_bd - beklenen_tam_bilgi) > 1e-9:
+                hatalar.append(f"{sira}. ağaç ({problem_turu}): BD {agac.beklenen_deger} / {beklenen_deger}, "
+                               f"tam bilgi ile BD {tam_bilgi_ile_bd} / {beklenen_tam_bilgi}")
+            elif agac.tam_bilginin_degeri() < -1e-9:
+                hatalar.append(f"{sira}. ağaç ({problem_turu}): tam bilginin değeri negatif.")
+
+    return kontrol_sayisi, hatalar
+
+
+def matris_dogrula():
+    """
+        Tek aşamalı bir karar matrisini aynı olayı gözlemleyen şans düğümleriyle ağaca çevirir ve tam bilginin
+        değerini, Risk Altında Karar Verme bölümündeki matris hesabıyla karşılaştırır.
+
+        Return:
+        - hatalar (list): Sonuçları eşleşmeyen durumların açıklamaları.
+        """
+
+    matris = [[200, 150, -20], [100, 110, 60], [40, 50, 55]]
+    olasiliklar = [0.3, 0.5, 0.2]
+    hatalar = []
+
+    for problem_turu in ['K', 'M']:
+        en_iyi = max if problem_turu == 'K' else min
+        kok = KararDugumu('Karar', {
+            f'Seçenek{i + 1}': SansDugumu('Talep', [(f'Durum{j + 1}', olasiliklar[j], SonucDugumu(deger))
+                                                   for j, deger in enumerate(satir)])
+            for i, satir in enumerate(matris)})
+
+        beklenen_degerler = [sum(deger * olasilik for deger, olasilik in zip(satir, olasiliklar)) for satir in matris]
+        tam_bilgi_ile_bd = sum(olasilik * en_iyi(sutun) for olasilik, sutun in zip(olasiliklar, zip(*matris)))
+        tam_bilginin_degeri = abs(tam_bilgi_ile_bd - en_iyi(beklenen_degerler))
+
+        agac = KararAgaci(kok, problem_turu)
+        if abs(agac.tam_bilginin_degeri() - tam_bilginin_degeri) > 1e-9:
+            hatalar.append(f"Matris ({problem_turu}): tam bilginin değeri {agac.tam_bilginin_degeri()} / "
+                           f"{tam_bilginin_degeri}")
+
+    return hatalar
+
+
+if __name__ == "__main__":
+    kontrol_sayisi, hatalar = dogrula()
+    hatalar += matris_dogrula()
+
+    for hata in hatalar:
+        print(hata)
+    print(f"{kontrol_sayisi} rastgele ağaç karşılaştırıldı, {len(hatalar)} hata bulundu.")
+
+    sys.exit(1 if hatalar else 0)
@@ -1,3 +1,5 @@
+import itertools
+
 import numpy as np
 import pandas as pd
 import seaborn as sns
@@ -640,6 +642,799 @@ class RiskAltindaKararVerme():
         print(f'\nTam bilgiye harcanması gereken maksimum tutar: {min(bfk)}')
 
 
+class SonucDugumu():
+    def __init__(self, deger):
+        """
+            Karar ağacında bir uç (sonuç) düğümü oluşturur.
+
+            Parameters:
+            - deger (float): Bu yolun sonunda elde edilen kazanç veya maliyet değeri.
+            """
+
+        self.deger = float(deger)
+
+
+class KararDugumu():
+    def __init__(self, ad, dallar):
+        """
+            Karar ağacında, karar vericinin seçenekler arasından seçim yaptığı bir karar düğümü oluşturur.
+
+            Parameters:
+            - ad (str): Karar düğümünün adı.
+            - dallar (dict): Seçenek isimlerini, seçeneğin götürdüğü alt düğümlerle eşleştiren bir sözlük.
+            """
+
+        if len(dallar) == 0:
+            raise ValueError("Hata: Karar düğümünün en az bir seçeneği olmalıdır.")
+
+        self.ad = ad
+        self.dallar = dict(dallar)
+
+
+class SansDugumu():
+    def __init__(self, ad, dallar):
+        """
+            Karar ağacında, bir doğal durumun gözlemlendiği şans düğümü oluşturur.
+
+            Parameters:
+            - ad (str): Şans düğümünün adı.
+            - dallar (list): (doğal durum, olasılık, alt düğüm) üçlülerini içeren bir liste.
+            """
+
+        if len(dallar) == 0:
+            raise ValueError("Hata: Şans düğümünün en az bir doğal durumu olmalıdır.")
+
+        if len(set(durum for durum, _, _ in dallar)) != len(dallar):
+            raise ValueError("Hata: Şans düğümündeki doğal durum isimleri birbirinden farklı olmalıdır.")
+
+        if any(olasilik < 0 or olasilik > 1 for _, olasilik, _ in dallar):
+            raise ValueError("Hata: Olasılıklar 0 ile 1 arasında olmalıdır.")
+
+        if not np.isclose(sum(olasilik for _, olasilik, _ in dallar), 1):
+            raise ValueError("Hata: Girilen olasılıkların toplamı 1'e eşit olmalıdır.")
+
+        self.ad = ad
+        self.dallar = [(durum, float(olasilik), dugum) for durum, olasilik, dugum in dallar]
+
+
+class KararAgaci():
+    def __init__(self, kok, problem_turu='K', azami_senaryo_sayisi=4096):
+        """
+            Çok aşamalı (karar - gözlem - karar) bir problemi karar ağacı olarak modeller ve
+            geriye doğru tümevarım ile çözer.
+
+            Aynı düğüm nesnesi birden fazla yerde kullanılabilir; ağaç bu durumda bir DAG olarak ele alınır.
+            Yapısal olarak birbirinin aynısı olan alt ağaçlar da tek bir kanonik kimlik altında birleştirilir,
+            böylece her farklı alt ağaç yalnızca bir kez hesaplanır. Dolaşım özyinelemesiz yapıldığı için
+            çok derin ağaçlar da çözülebilir.
+
+            Aynı isimli şans düğümleri ve birden fazla yoldan ulaşılan şans düğümleri aynı doğal olayı
+            temsil eder (ortak olay). Farklı olaylar birbirinden bağımsız kabul edilir.
+
+            Tam bilgi ile beklenen değer ilk istendiğinde hesaplanır. Ortak olayların her birlikte gerçekleşme
+            senaryosu ayrı ayrı değerlendirildiği için bu hesaplama ortak olay sayısına göre üsteldir; senaryo
+            sayısı azami_senaryo_sayisi değerini aşarsa hesaplama yapılmaz.
+
+            Parameters:
+            - kok (KararDugumu | SansDugumu | SonucDugumu): Ağacın kök düğümü.
+            - problem_turu (str): 'K' (kazanç) veya 'M' (maliyet) olarak belirtilen problem türü.
+            - azami_senaryo_sayisi (int): Tam bilgi hesabında değerlendirilecek en fazla senaryo sayısı.
+
+            Sınıf özellikleri:
+            - beklenen_deger (float): Geriye doğru tümevarım ile bulunan, kök düğümün beklenen değeri.
+            """
+
+        if problem_turu.upper() not in ["K", "M"]:
+            raise ValueError("Hata: Problem türü 'K' veya 'M' olmalıdır.")
+
+        self.kok = kok
+        self.problem_turu = problem_turu.upper()
+        self.en_iyi = max if self.problem_turu == 'K' else min
+        self.azami_senaryo_sayisi = azami_senaryo_sayisi
+
+        self._kimlikler = {}
+        self._anahtarlar = {}
+        self._yapilar = []
+        self._degerler = []
+        self._secimler = []
+        self._olaylar = {}
+        self._tam_bilgi_ile_bd = None
+
+        self.kok_kimligi = self.geriye_dogru_coz()
+        self.beklenen_deger = self._degerler[self.kok_kimligi]
+
+    def alt_dugumler(self, dugum):
+        """
+            Bir düğümün alt düğümlerini döndürür ve düğüm türünü kontrol eder.
+
+            Return:
+            - alt_dugumler (list): Düğümün doğrudan bağlı olduğu alt düğümler.
+            """
+
+        if isinstance(dugum, SonucDugumu):
+            return []
+        if isinstance(dugum, KararDugumu):
+            return list(dugum.dallar.values())
+        if isinstance(dugum, SansDugumu):
+            return [alt for _, _, alt in dugum.dallar]
+
+        raise TypeError(f"Hata: Tanınmayan düğüm türü: {type(dugum).__name__}")
+
+    def yapisal_anahtar(self, dugum):
+        """
+            Alt düğümleri daha önce kimliklendirilmiş bir düğümün yapısal anahtarını oluşturur.
+            Aynı anahtara sahip alt ağaçlar aynı beklenen değere ve aynı kararlara sahiptir.
+
+            Return:
+            - anahtar (tuple): Düğüm türü ve alt düğümlerin kanonik kimliklerinden oluşan bir tuple.
+            """
+
+        if isinstance(dugum, SonucDugumu):
+            return ('U', dugum.deger)
+        if isinstance(dugum, KararDugumu):
+            return ('K', tuple((secenek, self._kimlikler[id(alt)]) for secenek, alt in dugum.dallar.items()))
+
+        olay = tuple((durum, olasilik) for durum, olasilik, _ in dugum.dallar)
+        if self._olaylar.setdefault(dugum.ad, olay) != olay:
+            raise ValueError("Hata: Aynı isimli şans düğümleri aynı doğal durumlara ve olasılıklara sahip olmalıdır.")
+
+        return ('S', dugum.ad, tuple((durum, olasilik, self._kimlikler[id(alt)])
+                                     for durum, olasilik, alt in dugum.dallar))
+
+    def geriye_dogru_coz(self):
+        """
+            Ağacı sondan köke doğru (post-order) özyinelemesiz olarak dolaşır, her farklı alt ağaca bir
+            kanonik kimlik verir ve beklenen değerini yalnızca bir kez hesaplar.
+
+            Return:
+            - kok_kimligi (int): Kök düğümün kanonik kimliği.
+            """
+
+        yigin = [(self.kok, False)]
+        acik_dugumler = set()
+
+        while yigin:
+            dugum, alt_dugumler_hazir = yigin.pop()
+
+            if id(dugum) in self._kimlikler:
+                continue
+
+            if not alt_dugumler_hazir:
+                if id(dugum) in acik_dugumler:
+                    raise ValueError("Hata: Karar ağacı döngü içeremez.")
+
+                acik_dugumler.add(id(dugum))
+                yigin.append((dugum, True))
+                for alt in self.alt_dugumler(dugum):
+                    if id(alt) not in self._kimlikler:
+                        yigin.append((alt, False))
+                continue
+
+            anahtar = self.yapisal_anahtar(dugum)
+            kimlik = self._anahtarlar.get(anahtar)
+
+            if kimlik is None:
+                kimlik = len(self._yapilar)
+                self._anahtarlar[anahtar] = kimlik
+                self._yapilar.append(anahtar)
+                deger, secimler = self.dugum_degeri(anahtar)
+                self._degerler.append(deger)
+                self._secimler.append(secimler)
+
+            self._kimlikler[id(dugum)] = kimlik
+            acik_dugumler.discard(id(dugum))
+
+        return self._kimlikler[id(self.kok)]
+
+    def ayni_yoldaki_olaylari_kontrol_et(self):
+        """
+            Aynı isimli bir şans düğümü kökten uca giden bir yol üzerinde ikinci kez yer alıyorsa tam bilgi
+            hesabını engeller. Geriye doğru tümevarım böyle bir düğümü yeni bir gözlem gibi hesaplarken tam
+            bilgi onu ilk gözlemin sonucuna sabitler; bu durumda iki değer birbiriyle tutarsız olur.
+
+            Yalnızca birden fazla kanonik kimlikte geçen olaylar kontrol edilir; her düğüm için altındaki bu
+            olayların kümesi kimlik sırasıyla bir kez hesaplanır.
+            """
+
+        kimlik_sayisi = {}
+        for anahtar in self._yapilar:
+            if anahtar[0] == 'S':
+                kimlik_sayisi[anahtar[1]] = kimlik_sayisi.get(anahtar[1], 0) + 1
+
+        tekrarlar = {olay for olay, sayi in kimlik_sayisi.items() if sayi > 1}
+        if not tekrarlar:
+            return
+
+        alt_olaylar = []
+        for anahtar in self._yapilar:
+            if anahtar[0] == 'U':
+                alt_olaylar.append(frozenset())
+                continue
+
+            if anahtar[0] == 'K':
+                olaylar = frozenset().union(*(alt_olaylar[alt] for _, alt in anahtar[1]))
+            else:
+                olaylar = frozenset().union(*(alt_olaylar[alt] for _, _, alt in anahtar[2]))
+
+                if anahtar[1] in tekrarlar:
+                    if anahtar[1] in olaylar:
+                        raise ValueError(
+                            "Hata: Aynı isimli şans düğümü kökten uca giden bir yol üzerinde birden fazla kez yer alamaz.")
+                    olaylar = olaylar | {anahtar[1]}
+
+            alt_olaylar.append(olaylar)
+
+    def alt_kimlikleri(self, anahtar):
+        """
+            Yapısal anahtarı verilen düğümün alt düğümlerinin kanonik kimliklerini döndürür.
+
+            Return:
+            - alt_kimlikler (list): Alt düğümlerin kanonik kimlikleri.
+            """
+
+        if anahtar[0] == 'U':
+            return []
+        if anahtar[0] == 'K':
+            return [alt for _, alt in anahtar[1]]
+        return [alt for _, _, alt in anahtar[2]]
+
+    def dugum_degeri(self, anahtar):
+        """
+            Alt düğüm değerleri hesaplanmış bir düğümün beklenen değerini ve en iyi seçeneklerini bulur.
+
+            Returns:
+            - deger (float): Düğümün beklenen değeri.
+            - secimler (list): Karar düğümünde en iyi değeri veren seçenekler, diğer düğümlerde boş liste.
+            """
+
+        if anahtar[0] == 'U':
+            return anahtar[1], []
+
+        if anahtar[0] == 'K':
+            degerler = [(secenek, self._degerler[kimlik]) for secenek, kimlik in anahtar[1]]
+            deger = self.en_iyi(d for _, d in degerler)
+            return deger, [secenek for secenek, d in degerler if d == deger]
+
+        return sum(olasilik * self._degerler[kimlik] for _, olasilik, kimlik in anahtar[2]), []
+
+    def ortak_olaylar(self):
+        """
+            Tam bilgi altında birden fazla dalı aynı anda etkileyen olayları bulur. Bir şans düğümü ağaçta
+            birden fazla yerde geçiyorsa ya da kökten ona birden fazla yol ulaşıyorsa olayı ortaktır.
+
+            Returns:
+            - ortaklar (list): Ortak olayların isimleri.
+            - bagimlilar (list): Her kanonik kimlik için alt ağacın bir ortak olay içerip içermediği.
+            """
+
+        yol_sayisi = [0] * len(self._yapilar)
+        yol_sayisi[self.kok_kimligi] = 1
+        olay_sayisi = {}
+
+        for kimlik in range(len(self._yapilar) - 1, -1, -1):
+            anahtar = self._yapilar[kimlik]
+            if yol_sayisi[kimlik] == 0 or anahtar[0] == 'U':
+                continue
+
+            if anahtar[0] == 'S':
+                olay_sayisi[anahtar[1]] = olay_sayisi.get(anahtar[1], 0) + yol_sayisi[kimlik]
+                alt_kimlikler = [alt for _, _, alt in anahtar[2]]
+            else:
+                alt_kimlikler = [alt for _, alt in anahtar[1]]
+
+            for alt in alt_kimlikler:
+                yol_sayisi[alt] = min(2, yol_sayisi[alt] + yol_sayisi[kimlik])
+
+        ortaklar = [olay for olay, sayi in olay_sayisi.items() if sayi > 1]
+        ortak_kume = set(ortaklar)
+
+        bagimlilar = []
+        for anahtar in self._yapilar:
+            if anahtar[0] == 'U':
+                bagimlilar.append(False)
+            elif anahtar[0] == 'K':
+                bagimlilar.append(any(bagimlilar[alt] for _, alt in anahtar[1]))
+            else:
+                bagimlilar.append(anahtar[1] in ortak_kume or any(bagimlilar[alt] for _, _, alt in anahtar[2]))
+
+        return ortaklar, bagimlilar
+
+    def tam_bilgi_dagilimi(self, anahtar, dagilimlar, senaryo):
+        """
+            Tüm doğal olaylar karar verilmeden önce bilinseydi, düğümde elde edilecek değerin olasılık
+            dağılımını alt düğümlerin dağılımlarından hesaplar.
+
+            Ortak olaylarda senaryoda gerçekleşen durumun dalı izlenir. Diğer şans düğümlerinde dağılım, alt
+            dağılımların olasılıklarla ağırlıklı karışımıdır. Karar düğümünde karar verici gerçekleşecek
+            durumu bildiği için seçeneklerin en iyisini seçer; ortak olaylar sabitlendiğinde seçenekler
+            birbirinden bağımsız olduğundan en iyi değerin dağılımı, kümülatif dağılımların çarpımıyla bulunur.
+
+            Parameters:
+            - anahtar (tuple): Düğümün yapısal anahtarı.
+            - dagilimlar (list): Alt düğümlerin kanonik kimliklerine göre dağılımları.
+            - senaryo (dict): Ortak olayların bu senaryoda gerçekleşen durumları.
+
+            Returns:
+            - degerler (NumPy array): Küçükten büyüğe sıralı olası değerler.
+            - olasiliklar (NumPy array): Her değerin gerçekleşme olasılığı.
+            """
+
+        if anahtar[0] == 'U':
+            return np.array([anahtar[1]]), np.array([1.0])
+
+        if anahtar[0] == 'S':
+            if anahtar[1] in senaryo:
+                return next(dagilimlar[alt] for durum, _, alt in anahtar[2] if durum == senaryo[anahtar[1]])
+
+            tum_degerler = np.concatenate([dagilimlar[alt][0] for _, _, alt in anahtar[2]])
+            agirliklar = np.concatenate([olasilik * dagilimlar[alt][1] for _, olasilik, alt in anahtar[2]])
+            degerler, indeksler = np.unique(tum_degerler, return_inverse=True)
+            return degerler, np.bincount(indeksler.ravel(), weights=agirliklar, minlength=len(degerler))
+
+        alt_dagilimlar = [dagilimlar[alt] for _, alt in anahtar[1]]
+        degerler = np.unique(np.concatenate([d for d, _ in alt_dagilimlar]))
+        kumulatif = np.ones(len(degerler))
+
+        if self.problem_turu == 'K':
+            for alt_degerler, alt_olasiliklar in alt_dagilimlar:
+                birikimli = np.concatenate([[0.0], np.cumsum(alt_olasiliklar)])
+                kumulatif *= birikimli[np.searchsorted(alt_degerler, degerler, side='right')]
+            return degerler, np.diff(kumulatif, prepend=0.0)
+
+        for alt_degerler, alt_olasiliklar in alt_dagilimlar:
+            birikimli = np.concatenate([[0.0], np.cumsum(alt_olasiliklar)])
+            kumulatif *= 1 - birikimli[np.searchsorted(alt_degerler, degerler, side='left')]
+        return degerler, kumulatif - np.append(kumulatif[1:], 0.0)
+
+    def hesaplama_turleri(self, ortak_kume):
+        """
+            Tam bilgi hesabında her düğüm için tam dağılımın gerekip gerekmediğini belirler.
+
+            Ortak olaylar senaryoda sabitlendiğinden, altında ortak olmayan ve birden fazla durumu olan bir şans
+            düğümü bulunan alt ağaçlar rastgeledir. En az iki seçeneği olan ve seçeneklerinden biri rastgele olan
+            bir karar düğümü, en iyi değerin dağılımını bulmak için alt düğümlerinin tam dağılımına ihtiyaç
+            duyar; tam dağılım gereken düğümlerin alt düğümlerine de tam dağılım gerekir. Diğer düğümlerde
+            tam bilgi altındaki ortalama, alt düğümlerin ortalamalarından bulunur.
+
+            Parameters:
+            - ortak_kume (set): Ortak olayların isimleri.
+
+            Return:
+            - turler (list): Her kanonik kimlik için 'tam' (tam dağılım), 'daralt' (tam dağılım hesaplanıp
+              ortalamaya indirgenir) veya 'ortalama' (yalnızca ortalama) değeri.
+            """
+
+        rastgeleler = []
+        for anahtar in self._yapilar:
+            if anahtar[0] == 'U':
+                rastgeleler.append(False)
+            elif anahtar[0] == 'K':
+                rastgeleler.append(any(rastgeleler[alt] for _, alt in anahtar[1]))
+            else:
+                rastgeleler.append((anahtar[1] not in ortak_kume and len(anahtar[2]) > 1)
+                                   or any(rastgeleler[alt] for _, _, alt in anahtar[2]))
+
+        tam_gerekenler = [False] * len(self._yapilar)
+        turler = ['ortalama'] * len(self._yapilar)
+
+        for kimlik in range(len(self._yapilar) - 1, -1, -1):
+            anahtar = self._yapilar[kimlik]
+            if anahtar[0] == 'U':
+                continue
+
+            if anahtar[0] == 'K':
+                alt_kimlikler = [alt for _, alt in anahtar[1]]
+                secim_rastgele = len(alt_kimlikler) > 1 and any(rastgeleler[alt] for alt in alt_kimlikler)
+            else:
+                alt_kimlikler = [alt for _, _, alt in anahtar[2]]
+                secim_rastgele = False
+
+            if tam_gerekenler[kimlik]:
+                turler[kimlik] = 'tam'
+            elif secim_rastgele:
+                turler[kimlik] = 'daralt'
+
+            if tam_gerekenler[kimlik] or secim_rastgele:
+                for alt in alt_kimlikler:
+                    tam_gerekenler[alt] = True
+
+        return turler
+
+    def dugum_dagilimi(self, anahtar, tur, dagilimlar, senaryo):
+        """
+            Düğümün tam bilgi altındaki dağılımını hesaplama türüne göre bulur. Tam dağılım gerekmeyen
+            düğümlerde dağılım, ortalamada toplanmış tek noktalı bir dağılıma indirgenir.
+
+            Returns:
+            - degerler (NumPy array): Küçükten büyüğe sıralı olası değerler.
+            - olasiliklar (NumPy array): Her değerin gerçekleşme olasılığı.
+            """
+
+        if tur != 'ortalama' or anahtar[0] == 'U':
+            degerler, olasiliklar = self.tam_bilgi_dagilimi(anahtar, dagilimlar, senaryo)
+            if tur == 'tam':
+                return degerler, olasiliklar
+            return np.array([np.dot(degerler, olasiliklar)]), np.array([1.0])
+
+        def ortalama(kimlik):
+            return float(np.dot(*dagilimlar[kimlik]))
+
+        if anahtar[0] == 'K':
+            deger = self.en_iyi(ortalama(alt) for _, alt in anahtar[1])
+        elif anahtar[1] in senaryo:
+            deger = next(ortalama(alt) for durum, _, alt in anahtar[2] if durum == senaryo[anahtar[1]])
+        else:
+            deger = sum(olasilik * ortalama(alt) for _, olasilik, alt in anahtar[2])
+
+        return np.array([deger]), np.array([1.0])
+
+    def tam_bilgi_ile_beklenen_deger(self):
+        """
+            Tam bilgi ile beklenen değeri, ortak olayların her senaryosu için dağılımları hesaplayarak bulur.
+            Kanonik kimlikler alt düğümlerden sonra verildiği için dağılımlar kimlik sırasıyla hesaplanır;
+            ortak olaylardan etkilenmeyen alt ağaçların dağılımları senaryolar arasında yeniden kullanılır.
+            Bir düğümün dağılımı, onu kullanan son üst düğüm hesaplandıktan sonra bırakılır; böylece bellekte
+            yalnızca henüz kullanılmamış dağılımlar tutulur. Sonuç ilk hesaplamadan sonra saklanır.
+
+            Tam dağılım, yalnızca rastgele seçenekler arasında seçim yapan karar düğümlerinin altında tutulur
+            ve en fazla alt ağaçtaki farklı uç değer sayısı kadar noktadan oluşur; bu bölgede maliyet
+            düğüm sayısı ile farklı uç değer sayısının çarpımı kadardır. Ağacın geri kalanında yalnızca
+            ortalamalar taşındığı için hesaplama düğüm sayısıyla doğrusal kalır.
+
+            Return:
+            - tam_bilgi_ile_bd (float): Tam bilgi altında kök düğümün beklenen değeri.
+            """
+
+        if self._tam_bilgi_ile_bd is not None:
+            return self._tam_bilgi_ile_bd
+
+        self.ayni_yoldaki_olaylari_kontrol_et()
+        ortaklar, bagimlilar = self.ortak_olaylar()
+
+        senaryo_sayisi = 1
+        for olay in ortaklar:
+            senaryo_sayisi *= len(self._olaylar[olay])
+            if senaryo_sayisi > self.azami_senaryo_sayisi:
+                raise ValueError(f"Hata: Tam bilgi hesabı için {len(ortaklar)} ortak olayın senaryo sayısı "
+                                 f"{self.azami_senaryo_sayisi} sınırını aşıyor.")
+
+        hesaplama_turleri = self.hesaplama_turleri(set(ortaklar))
+        bagimli_kimlikler = [kimlik for kimlik, bagimli in enumerate(bagimlilar) if bagimli]
+
+        sabit_kullanim = [0] * len(self._yapilar)
+        bagimli_kullanim = dict.fromkeys(bagimli_kimlikler, 0)
+        korunanlar = set()
+        for kimlik, anahtar in enumerate(self._yapilar):
+            for alt in self.alt_kimlikleri(anahtar):
+                if not bagimlilar[kimlik]:
+                    sabit_kullanim[alt] += 1
+                elif bagimlilar[alt]:
+                    bagimli_kullanim[alt] += 1
+                else:
+                    korunanlar.add(alt)
+
+        dagilimlar = [None] * len(self._yapilar)
+        for kimlik, anahtar in enumerate(self._yapilar):
+            if bagimlilar[kimlik]:
+                continue
+
+            dagilimlar[kimlik] = self.dugum_dagilimi(anahtar, hesaplama_turleri[kimlik], dagilimlar, {})
+            for alt in self.alt_kimlikleri(anahtar):
+                sabit_kullanim[alt] -= 1
+                if sabit_kullanim[alt] == 0 and alt not in korunanlar:
+                    dagilimlar[alt] = None
+
+        if not ortaklar:
+            degerler, olasiliklar = dagilimlar[self.kok_kimligi]
+            self._tam_bilgi_ile_bd = float(np.sum(degerler * olasiliklar))
+            return self._tam_bilgi_ile_bd
+
+        tam_bilgi_ile_bd = 0.0
+        for gerceklesenler in itertools.product(*(self._olaylar[olay] for olay in ortaklar)):
+            senaryo = {olay: durum for olay, (durum, _) in zip(ortaklar, gerceklesenler)}
+            senaryo_olasiligi = np.prod([olasilik for _, olasilik in gerceklesenler])
+
+            if senaryo_olasiligi == 0:
+                continue
+
+            kalan_kullanim = dict(bagimli_kullanim)
+            for kimlik in bagimli_kimlikler:
+                anahtar = self._yapilar[kimlik]
+                dagilimlar[kimlik] = self.dugum_dagilimi(anahtar, hesaplama_turleri[kimlik], dagilimlar, senaryo)
+                for alt in self.alt_kimlikleri(anahtar):
+                    if bagimlilar[alt]:
+                        kalan_kullanim[alt] -= 1
+                        if kalan_kullanim[alt] == 0:
+                            dagilimlar[alt] = None
+
+            degerler, olasiliklar = dagilimlar[self.kok_kimligi]
+            tam_bilgi_ile_bd += senaryo_olasiligi * float(np.sum(degerler * olasiliklar))
+
+        self._tam_bilgi_ile_bd = tam_bilgi_ile_bd
+        return self._tam_bilgi_ile_bd
+
+    def tam_bilginin_degeri(self):
+        """
+            Tam bilginin beklenen değerini (EVPI) hesaplar.
+
+            Return:
+            - tam_bilginin_degeri (float): Tam bilgi ile beklenen değer ile beklenen değer arasındaki kazanç.
+            """
+
+        if self.problem_turu == 'K':
+            return self.tam_bilgi_ile_beklenen_deger() - self.beklenen_deger
+        return self.beklenen_deger - self.tam_bilgi_ile_beklenen_deger()
+
+    def optimal_strateji(self):
+        """
+            Kökten başlayarak en iyi politikanın ulaştığı karar düğümlerini ve bu düğümlerde seçilmesi
+            gereken seçenekleri bulur.
+
+            Return:
+            - strateji (list): (karar düğümü adı, seçilmesi gereken seçenek(ler)) ikililerini içeren bir liste.
+            """
+
+        strateji = []
+        ziyaret_edilenler = set()
+        yigin = [self.kok]
+
+        while yigin:
+            dugum = yigin.pop()
+
+            if id(dugum) in ziyaret_edilenler:
+                continue
+            ziyaret_edilenler.add(id(dugum))
+
+            if isinstance(dugum, KararDugumu):
+                secimler = self._secimler[self._kimlikler[id(dugum)]]
+                strateji.append((dugum.ad, ', '.join(secimler)))
+                yigin.append(dugum.dallar[secimler[0]])
+            elif isinstance(dugum, SansDugumu):
+                yigin.extend(alt for _, _, alt in reversed(dugum.dallar))
+
+        return strateji
+
+    def firsat_kaybi(self):
+        """
+            Kök karar düğümündeki her seçeneğin beklenen değerini ve beklenen fırsat kaybını hesaplar.
+            Bir seçeneğin beklenen fırsat kaybı, tam bilgi ile beklenen değer ile seçeneğin beklenen değeri
+            arasındaki farktır; en küçük beklenen fırsat kaybı tam bilginin değerine eşittir.
+
+            Return:
+            - fk_df (pd.DataFrame): Seçeneklerin beklenen değerlerini ve beklenen fırsat kayıplarını içeren DataFrame.
+            """
+
+        if not isinstance(self.kok, KararDugumu):
+            raise ValueError("Hata: Fırsat kaybı için kök düğüm bir karar düğümü olmalıdır.")
+
+        secenekler = list(self.kok.dallar)
+        beklenen_degerler = [self._degerler[self._kimlikler[id(alt)]] for alt in self.kok.dallar.values()]
+        tam_bilgi_ile_bd = self.tam_bilgi_ile_beklenen_deger()
+
+        if self.problem_turu == 'K':
+            bfk = [tam_bilgi_ile_bd - deger for deger in beklenen_degerler]
+        else:
+            bfk = [deger - tam_bilgi_ile_bd for deger in beklenen_degerler]
+
+        return pd.DataFrame({'Beklenen Değerler': beklenen_degerler, 'BFK': bfk}, index=secenekler)
+
+
+class CokAsamaliKararVerme():
+    def __init__(self):
+        """
+            Çok aşamalı (karar - gözlem - karar) bir karar verme problemi için bir sınıf başlatır.
+
+            Kullanıcıdan aşağıdaki bilgileri alarak sınıfı başlatır:
+            - problem_turu (str): 'K' (kazanç) veya 'M' (maliyet) olarak belirtilen problem türü.
+            - dugumler (dict): Kullanıcının girdiği düğüm isimlerini düğümlerle eşleştiren bir sözlük.
+              Daha önce girilmiş bir düğüm ismi tekrar kullanıldığında aynı alt ağaç paylaşılır.
+            - olaylar (dict): Şans düğümlerinde gözlemlenen olay isimlerini doğal durumları ve olasılıklarıyla
+              eşleştiren bir sözlük. Farklı şans düğümleri aynı olay ismini kullanarak aynı olayı gözlemleyebilir.
+            - agac (KararAgaci): Kullanıcının girdiği ağaçtan oluşturulan ve çözülen karar ağacı.
+            """
+
+        self.problem_turu = self.problem_secimi()
+        self.dugumler = {}
+        self.olaylar = {}
+        self.girilen_dugumler = set()
+        self.agac = KararAgaci(self.dugum_gir(self.kok_adi_gir()), self.problem_turu)
+        self.hesaplamalari_yazdir()
+
+    def problem_secimi(self):
+        """
+            Kullanıcının problem türünü girmesini sağlar ve hata kontrolü yapar.
+
+            Return:
+            - problem_turu (str): Kullanıcının girdiği problem türünü temsil eden "K" (kazanç) veya "M" (maliyet) değeri.
+            """
+        while True:
+            problem_turu = input("Eğer problem türünüz kazanç ise 'K', maliyet ise 'M' yazınız: ")
+
+            if problem_turu.upper() not in ["K", "M"]:
+                print("Hata: Geçersiz giriş. Lütfen 'K' veya 'M' girin.")
+                continue
+            else:
+                break
+        return problem_turu.upper()
+
+    def kok_adi_gir(self):
+        """
+            Kullanıcıdan kök düğümün adını alır.
+
+            Return:
+            - kok_adi (str): Kök düğümün adı.
+            """
+        while True:
+            kok_adi = input("İlk karar düğümünün adını birleşik olacak şekilde giriniz: (ör: YatırımKararı) ").strip()
+
+            if kok_adi:
+                return kok_adi
+            print("Hata: Düğüm adı boş olamaz.")
+
+    def alt_dugum_adi_gir(self, mesaj):
+        """
+            Kullanıcıdan bir dalın götürdüğü düğümün adını alır, ağaçta döngü oluşmaması için kontrol yapar.
+
+            Return:
+            - alt_ad (str): Alt düğümün adı.
+            """
+        while True:
+            alt_ad = input(mesaj).strip()
+
+            if not alt_ad:
+                print("Hata: Düğüm adı boş olamaz.")
+            elif alt_ad in self.girilen_dugumler:
+                print("Hata: Bu düğüm henüz tamamlanmadı, kendisine geri dönen bir dal döngü oluşturur.")
+            else:
+                return alt_ad
+
+    def olay_adi_gir(self, ad):
+        """
+            Kullanıcıdan şans düğümünde gözlemlenen olayın adını alır. Olay adı düğüm adından ayrıdır;
+            farklı getirileri olan şans düğümleri aynı olay adını vererek aynı olayı gözlemleyebilir.
+
+            Return:
+            - olay (str): Gözlemlenen olayın adı.
+            """
+        while True:
+            olay = input(f"'{ad}' düğümünde gözlemlenen olayın adını birleşik olacak şekilde giriniz: (ör: Talep) ").strip()
+
+            if olay:
+                return olay
+            print("Hata: Olay adı boş olamaz.")
+
+    def dugum_gir(self, ad):
+        """
+            Kullanıcıdan verilen isimdeki düğümü ve alt düğümlerini alır. İsim daha önce girildiyse
+            aynı düğüm tekrar kullanılır.
+
+            Return:
+            - dugum (KararDugumu | SansDugumu | SonucDugumu): Kullanıcının girdiği düğüm.
+            """
+
+        if ad in self.dugumler:
+            return self.dugumler[ad]
+
+        while True:
+            tur = input(f"'{ad}' düğümü karar ise 'K', şans ise 'S', sonuç ise 'U' yazınız: ").upper()
+
+            if tur not in ["K", "S", "U"]:
+                print("Hata: Geçersiz giriş. Lütfen 'K', 'S' veya 'U' girin.")
+            else:
+                break
+
+        self.girilen_dugumler.add(ad)
+
+        if tur == 'U':
+            while True:
+                try:
+                    dugum = SonucDugumu(float(input(f"'{ad}' sonucunun değerini giriniz: ")))
+                    break
+                except ValueError:
+                    print("Hatalı giriş. Lütfen sayısal bir değer girin.")
+
+        elif tur == 'K':
+            while True:
+                secenekler = input(f"'{ad}' düğümündeki seçenekleri aralarında boşluk bırakarak giriniz: ").split()
+
+                if len(secenekler) == 0 or len(set(secenekler)) != len(secenekler):
+                    print("Hata: En az bir seçenek girilmeli ve seçenek isimleri birbirinden farklı olmalıdır.\n")
+                else:
+                    break
+
+            dallar = {}
+            for secenek in secenekler:
+                alt_ad = self.alt_dugum_adi_gir(f"'{ad}' düğümünde '{secenek}' seçeneğinin götürdüğü düğümün adı: ")
+                dallar[secenek] = self.dugum_gir(alt_ad)
+            dugum = KararDugumu(ad, dallar)
+
+        else:
+            olay = self.olay_adi_gir(ad)
+
+            if olay in self.olaylar:
+                durumlar, olasiliklar = self.olaylar[olay]
+                print(f"'{olay}' olayının doğal durumları ({' '.join(durumlar)}) ve olasılıkları kullanılıyor.")
+
+            while olay not in self.olaylar:
+                durumlar = input(
+                    f"'{olay}' olayının doğal durumlarını aralarında boşluk bırakarak giriniz: (ör: DüşükTalep) ").split()
+
+                if len(durumlar) == 0 or len(set(durumlar)) != len(durumlar):
+                    print("Hata: En az bir doğal durum girilmeli ve doğal durum isimleri birbirinden farklı olmalıdır.\n")
+                    continue
+
+                try:
+                    olasiliklar = list(map(float, input('Olasılıkları aralarında boşluk bırakarak giriniz: ').split()))
+
+                    if len(olasiliklar) != len(durumlar):
+                        raise ValueError("Hata: Girilen olasılık sayısı, doğal durum sayısı ile eşleşmiyor.")
+
+                    SansDugumu(olay, [(durum, olasilik, None) for durum, olasilik in zip(durumlar, olasiliklar)])
+                    self.olaylar[olay] = (durumlar, olasiliklar)
+
+                except ValueError as h:
+                    print(h)
+                    print("Hatalı giriş. Lütfen tekrar deneyin.")
+
+            dallar = []
+            for durum, olasilik in zip(durumlar, olasiliklar):
+                alt_ad = self.alt_dugum_adi_gir(f"'{ad}' düğümünde '{durum}' durumunun götürdüğü düğümün adı: ")
+                dallar.append((durum, olasilik, self.dugum_gir(alt_ad)))
+            dugum = SansDugumu(olay, dallar)
+
+        self.girilen_dugumler.discard(ad)
+        self.dugumler[ad] = dugum
+        return dugum
+
+    def veri_gorsellestirme(self, fk_df):
+        """
+            Kök karardaki seçeneklerin beklenen değerlerini ve beklenen fırsat kayıplarını sütun grafiği ile görselleştirir.
+
+            Parameters:
+            - fk_df (pd.DataFrame): Seçeneklerin beklenen değerlerini ve beklenen fırsat kayıplarını içeren DataFrame.
+
+            Return:
+            None: Sütun grafiğini ekranda gösterir.
+            """
+        grafik_df = fk_df.reset_index().melt(id_vars='index', var_name='Ölçüt', value_name='Değer')
+
+        plt.figure(figsize=(12, 6))
+        sns.set(style='darkgrid')
+        sns.barplot(data=grafik_df, x='index', y='Değer', hue='Ölçüt', palette='tab10')
+        plt.xlabel('Seçenekler', fontsize=18)
+        plt.ylabel('Değerler', fontsize=18)
+        plt.title('Seçeneklerin Beklenen Değerleri ve Fırsat Kayıpları', fontsize=22)
+        plt.tick_params(axis='x', labelsize=14)
+        plt.tick_params(axis='y', labelsize=14)
+        plt.show()
+
+    def hesaplamalari_yazdir(self):
+        """
+            Geriye doğru tümevarım sonuçlarını, optimal stratejiyi, fırsat kayıplarını ve tam bilginin değerini
+            ekrana yazdırır ve veri görselleştirmesi yapar.
+            """
+
+        print("\n\n\nOPTİMAL STRATEJİ;")
+        for karar, secim in self.agac.optimal_strateji():
+            print(f"{karar} düğümünde kararınız {secim} olmalıdır.")
+
+        print(f"\nBeklenen değer: {self.agac.beklenen_deger}")
+
+        try:
+            tam_bilgi_ile_bd = self.agac.tam_bilgi_ile_beklenen_deger()
+        except ValueError as h:
+            print(f"\n{h}")
+            return
+
+        print(f"\nTam bilgi ile BD: {tam_bilgi_ile_bd}")
+
+        if isinstance(self.agac.kok, KararDugumu):
+            fk_df = self.agac.firsat_kaybi()
+            print("\nBEKLENEN FIRSAT KAYIPLARI;")
+            print(fk_df)
+            self.veri_gorsellestirme(fk_df)
+
+        print(f'\nTam bilgiye harcanması gereken maksimum tutar: {self.agac.tam_bilginin_degeri()}')
 
 
 # Kullanım için bir örnek
@@ -657,11 +1452,23 @@ def main():
         problem = 0
     elif problem_cesidi == 'E':
         problem += 1
+        while True:
+            asama_cesidi = input(
+                "Probleminiz çok aşamalı mı? (karar ver - durumu gözlemle - tekrar karar ver) (E/H) yazınız ")
+            if asama_cesidi.upper() not in ["E", "H"]:
+                print("Geçersiz giriş! Sadece 'E' veya 'H' giriniz.")
+                continue
+            else:
+                break
+        if asama_cesidi.upper() == 'E':
+            problem += 1
 
     if problem == 0:
         BelirsizlikAltindaKararVerme()
-    else:
+    elif problem == 1:
         RiskAltindaKararVerme()
+    else:
+        CokAsamaliKararVerme()
 
 if __name__ == "__main__":
     main()